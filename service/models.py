@@ -169,12 +169,42 @@ class Product(db.Model):
         app.app_context().push()
         db.create_all()  # make our sqlalchemy tables
 
+    @classmethod
+    def create_batch(cls, products: list):
+        """Creates a batch of Products in the database with a single commit
+
+        :param products: the Products to create
+        :type products: list
+
+        """
+        logger.info("Creating %d Products", len(products))
+        for product in products:
+            # id must be none to generate next primary key
+            product.id = None
+        db.session.add_all(products)
+        db.session.commit()
+
     @classmethod
     def all(cls) -> list:
         """Returns all of the Products in the database"""
         logger.info("Processing all Products")
         return cls.query.all()
 
+    @classmethod
+    def count_by(cls, **filters) -> int:
+        """Returns the number of Products matching the given filters
+
+        :param filters: the column values to match, e.g. available=True
+        :type filters: dict
+
+        :return: the number of matching Products
+        :rtype: int
+
+        """
+        logger.info("Processing count query for %s ...", filters)
+        statement = db.select(db.func.count()).select_from(cls).filter_by(**filters)
+        return db.session.execute(statement).scalar()
+
     @classmethod
     def find(cls, product_id: int):
         """Finds a Product by it's ID
@@ -30,7 +30,7 @@ class ProductFactory(factory.Factory):
 
         model = Product
 
-    id = factory.Sequence(lambda n: n)
+    # id is left unset so the database assigns it
     # Add code to create Fake Products
     name = FuzzyChoice(
         choices=[